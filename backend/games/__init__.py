@@ -1,16 +1,25 @@
-from typing import Dict, Any, Type
+import importlib
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Type
 from .cards import CARD_GAMES
 
-# Map of game IDs to game classes and metadata
-GAMES: Dict[str, Dict[str, Any]] = {
+# Read-only map of game IDs to game metadata
+GAMES: Mapping[str, Dict[str, Any]] = MappingProxyType({
     **CARD_GAMES  # Add all card games
-}
+})
+
+@lru_cache(maxsize=None)
+def _load_game_class(module: str, class_name: str) -> Type:
+    """Import a game module and return its game class"""
+    return getattr(importlib.import_module(module), class_name)
 
 def get_game_class(game_id: str) -> Type:
     """Get the game class for a given game ID"""
     if game_id not in GAMES:
         raise ValueError(f"Unknown game: {game_id}")
-    return GAMES[game_id]['class']
+    info = GAMES[game_id]
+    return _load_game_class(info['module'], info['class_name'])
 
 def get_game_info(game_id: str) -> Dict[str, Any]:
     """Get game information for a given game ID"""
@@ -18,7 +27,7 @@ def get_game_info(game_id: str) -> Dict[str, Any]:
         raise ValueError(f"Unknown game: {game_id}")
     return GAMES[game_id]
 
-def list_games() -> Dict[str, Dict[str, Any]]:
+def list_games() -> Mapping[str, Dict[str, Any]]:
     """Get information about all available games"""
     return GAMES
 
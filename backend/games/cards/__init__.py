@@ -1,66 +1,67 @@
+import importlib
 from .models import Card, Rank, Suit, GameState
-from .snap import SnapGame
-from .go_fish import GoFishGame
-from .bluff import BluffGame
-from .scat import ScatGame
-from .rummy import RummyGame
-from .kings_corner import KingsCornerGame
-from .spades import SpadesGame
-from .spoons import SpoonsGame
 
-# Map of game IDs to game classes
+# Map of game IDs to game metadata; game classes are imported on first use
 CARD_GAMES = {
     'snap': {
-        'class': SnapGame,
+        'module': f'{__name__}.snap',
+        'class_name': 'SnapGame',
         'name': 'Snap',
         'min_players': 2,
         'max_players': 6,
         'description': 'Race to collect all cards by being the first to spot matching ranks.'
     },
     'go_fish': {
-        'class': GoFishGame,
+        'module': f'{__name__}.go_fish',
+        'class_name': 'GoFishGame',
         'name': 'Go Fish',
         'min_players': 2,
         'max_players': 6,
         'description': 'Collect sets of four cards by asking other players for specific ranks.'
     },
     'bluff': {
-        'class': BluffGame,
+        'module': f'{__name__}.bluff',
+        'class_name': 'BluffGame',
         'name': 'Bluff',
         'min_players': 2,
         'max_players': 6,
         'description': 'Get rid of all your cards by playing them face down and claiming their ranks. But beware - other players can challenge your claims!'
     },
     'scat': {
-        'class': ScatGame,
+        'module': f'{__name__}.scat',
+        'class_name': 'ScatGame',
         'name': 'Scat (31)',
         'min_players': 2,
         'max_players': 6,
         'description': 'Try to get the highest score in one suit (up to 31) or knock if you think you have the best hand.'
     },
     'rummy': {
-        'class': RummyGame,
+        'module': f'{__name__}.rummy',
+        'class_name': 'RummyGame',
         'name': 'Rummy',
         'min_players': 2,
         'max_players': 6,
         'description': 'Form sets (same rank) and runs (sequential cards of same suit) to get rid of all your cards.'
     },
     'kings_corner': {
-        'class': KingsCornerGame,
+        'module': f'{__name__}.kings_corner',
+        'class_name': 'KingsCornerGame',
         'name': 'Kings in the Corner',
         'min_players': 2,
         'max_players': 4,
         'description': 'Get rid of all your cards by building foundation piles in descending order, alternating colors.'
     },
     'spades': {
-        'class': SpadesGame,
+        'module': f'{__name__}.spades',
+        'class_name': 'SpadesGame',
         'name': 'Spades',
         'min_players': 4,
         'max_players': 4,
         'description': 'A trick-taking game where spades are always trump. Bid the number of tricks you think you can win.'
     },
     'spoons': {
-        'class': SpoonsGame,
+        'module': f'{__name__}.spoons',
+        'class_name': 'SpoonsGame',
         'name': 'Spoons',
         'min_players': 3,
         'max_players': 8,
@@ -68,6 +69,18 @@ CARD_GAMES = {
     }
 }
 
+# Game class name -> module that defines it
+_GAME_CLASS_MODULES = {info['class_name']: info['module'] for info in CARD_GAMES.values()}
+
+def __getattr__(name: str):
+    """Import game classes lazily so only the games actually used are loaded"""
+    module = _GAME_CLASS_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    game_class = getattr(importlib.import_module(module), name)
+    globals()[name] = game_class
+    return game_class
+
 # Export all game-related classes and constants
 __all__ = [
     'Card', 'Rank', 'Suit', 'GameState',
@@ -1,12 +1,23 @@
 from typing import Dict, Any, Optional, List, Tuple
-from .models import BaseGame, Card, GameState, Player, Rank
+from .models import RANK_BY_VALUE, BaseGame, Card, GameState, Player, Rank
 import random
 
+# Rank order used to advance the required rank after each play
+_RANKS: Tuple[Rank, ...] = tuple(Rank)
+_RANK_INDEX: Dict[Rank, int] = {r: i for i, r in enumerate(_RANKS)}
+_NUM_RANKS = len(_RANKS)
+
+def _card_sort_key(card: Card) -> Tuple[str, str]:
+    """Sort key used to keep hands ordered"""
+    return (card.rank.value, card.suit.value)
+
 class BluffGame(BaseGame):
     def __init__(self, room_code: str):
         super().__init__(room_code)
         self.center_pile: List[Tuple[List[Card], Rank]] = []  # List of (cards, claimed_rank)
+        self._center_pile_flat: List[Card] = []  # All cards in center_pile, kept in sync by play_cards/challenge
         self.last_action: Optional[Dict[str, Any]] = None
+        self._last_player: Optional[Player] = None  # Player who made the most recent play
         self.current_rank: Optional[Rank] = None  # The rank that must be played next
         self.cards_per_play = 1  # Number of cards that must be played (can increase with multiple same-rank cards)
         self.max_selectable_cards = 4  # Players can play up to 4 cards of the same rank
@@ -16,21 +27,17 @@ class BluffGame(BaseGame):
         # In Bluff, cards are divided equally among players
         return 52  # Use full deck
 
+    def start_game(self):
+        """Start the game and sort the dealt hands"""
+        super().start_game()
+        # Hands are shown sorted; challenges re-sort after picking up the pile
+        for player in self.players.values():
+            player.hand.sort(key=_card_sort_key)
+
     def play_cards(self, player_id: str, card_indices: List[int], claimed_rank: str) -> Dict[str, Any]:
         """Play cards from hand, claiming they are of a specific rank"""
         try:
-            if self.state != GameState.PLAYING:
-                raise ValueError("Game is not in playing state")
-
-            player = self.players.get(str(player_id))
-            if not player:
-                raise ValueError("Player not found")
-
-            if not self.current_player:
-                raise ValueError("No current player set")
-
-            if player.id != self.current_player.id:
-                raise ValueError("Not your turn")
+            player = self._require_current_player(player_id)
 
             # Validate card indices
             if not card_indices:
@@ -39,28 +46,27 @@ class BluffGame(BaseGame):
             if len(card_indices) != self.cards_per_play:
                 raise ValueError(f"Must play exactly {self.cards_per_play} cards")
 
-            if any(i < 0 or i >= len(player.hand) for i in card_indices):
+            hand = player.hand
+            hand_size = len(hand)
+            if any(i < 0 or i >= hand_size for i in card_indices):
                 raise ValueError("Invalid card indices")
 
             # Convert claimed rank string to Rank enum
-            try:
-                rank_enum = next(r for r in Rank if r.value == claimed_rank)
-            except StopIteration:
+            rank_enum = RANK_BY_VALUE.get(claimed_rank)
+            if rank_enum is None:
                 raise ValueError("Invalid rank")
 
             # Validate claimed rank matches required rank if set
             if self.current_rank and rank_enum != self.current_rank:
                 raise ValueError(f"Must play {self.current_rank.value}")
 
-            # Get cards being played
-            cards = [player.hand[i] for i in sorted(card_indices, reverse=True)]
-            
-            # Remove cards from hand
-            for i in sorted(card_indices, reverse=True):
-                player.hand.pop(i)
+            # Remove cards being played from hand, highest index first so earlier indices stay valid
+            cards = [hand.pop(i) for i in sorted(card_indices, reverse=True)]
 
             # Add cards to center pile
             self.center_pile.append((cards, rank_enum))
+            self._center_pile_flat.extend(cards)
+            self._last_player = player
 
             # Update game state
             self.last_action = {
@@ -75,8 +81,7 @@ class BluffGame(BaseGame):
             self.next_turn()
 
             # Set next required rank
-            next_rank_idx = (list(Rank).index(rank_enum) + 1) % len(Rank)
-            self.current_rank = list(Rank)[next_rank_idx]
+            self.current_rank = _RANKS[(_RANK_INDEX[rank_enum] + 1) % _NUM_RANKS]
 
             # Check for win condition
             if not player.hand:
@@ -100,7 +105,7 @@ class BluffGame(BaseGame):
             if not self.center_pile:
                 raise ValueError("No cards to challenge")
 
-            challenger = self.players.get(str(challenger_id))
+            challenger = self.players.get(challenger_id)
             if not challenger:
                 raise ValueError("Player not found")
 
@@ -108,8 +113,7 @@ class BluffGame(BaseGame):
             last_cards, claimed_rank = self.center_pile[-1]
             
             # Find the last player
-            last_player_idx = (self.current_player_idx - 1) % len(self.players)
-            last_player = self.player_order[last_player_idx]
+            last_player = self._last_player
             if not last_player:
                 raise ValueError("Last player not found")
 
@@ -117,16 +121,16 @@ class BluffGame(BaseGame):
             was_bluffing = any(card.rank != claimed_rank for card in last_cards)
 
             # Collect all cards from center pile
-            all_cards = [card for cards, _ in self.center_pile for card in cards]
+            all_cards = self._center_pile_flat
             total_cards = len(all_cards)
 
             if was_bluffing:
                 # Challenger was right - last player takes the center pile
+                # Sort after adding the pile; a hand that is already sorted merges in linear time
                 last_player.hand.extend(all_cards)
+                last_player.hand.sort(key=_card_sort_key)
                 self.center_pile.clear()
-                
-                # Sort the received cards
-                last_player.hand.sort(key=lambda card: (card.rank.value, card.suit.value))
+                self._center_pile_flat = []
 
                 self.last_action = {
                     'action': 'challenge_success',
@@ -141,11 +145,11 @@ class BluffGame(BaseGame):
                 challenger.score += 1
             else:
                 # Challenger was wrong - they take the center pile
+                # Sort after adding the pile; a hand that is already sorted merges in linear time
                 challenger.hand.extend(all_cards)
+                challenger.hand.sort(key=_card_sort_key)
                 self.center_pile.clear()
-                
-                # Sort the received cards
-                challenger.hand.sort(key=lambda card: (card.rank.value, card.suit.value))
+                self._center_pile_flat = []
 
                 self.last_action = {
                     'action': 'challenge_failed',
@@ -180,52 +184,26 @@ class BluffGame(BaseGame):
 
     def get_game_state(self, for_player_id: Optional[str] = None) -> Dict[str, Any]:
         """Get the current game state"""
-        try:
-            # Get base game state
-            base_state = super().get_game_state(for_player_id)
-            
-            # Calculate center pile information
-            total_cards = sum(len(cards) for cards, _ in self.center_pile)
-            
-            # Get last played info safely
-            last_played = None
-            try:
-                if self.center_pile:
-                    last_cards, last_rank = self.center_pile[-1]
-                    last_played = {
-                        'cards_count': len(last_cards),
-                        'claimed_rank': last_rank.value
-                    }
-            except Exception:
-                # If there's any error getting last played info, leave it as None
-                pass
-            
-            # Create bluff specific state
-            bluff_state = {
-                'center_pile_count': total_cards,
-                'last_played': last_played,
-                'next_rank': self.current_rank.value if self.current_rank else None,
-                'cards_per_play': self.cards_per_play,
-                'last_action': self.last_action
-            }
-            
-            # Merge states
-            return {**base_state, **bluff_state}
-            
-        except Exception as e:
-            # Return minimal valid state on error
-            return {
-                'room_code': self.room_code,
-                'state': GameState.WAITING.value,
-                'players': {},  # Empty dict to match base game state structure
-                'current_player': None,
-                'deck': {'cards': []},
-                'direction': self.direction,
-                'current_player_idx': 0,
-                'center_pile_count': 0,
-                'last_played': None,
-                'next_rank': None,
-                'cards_per_play': 1,
-                'last_action': None,
-                'error': str(e)
+        # Get base game state
+        base_state = super().get_game_state(for_player_id)
+        
+        # Get last played info
+        last_played = None
+        if self.center_pile:
+            last_cards, last_rank = self.center_pile[-1]
+            last_played = {
+                'cards_count': len(last_cards),
+                'claimed_rank': last_rank.value
             }
+        
+        # Create bluff specific state
+        bluff_state = {
+            'center_pile_count': len(self._center_pile_flat),
+            'last_played': last_played,
+            'next_rank': self.current_rank.value if self.current_rank else None,
+            'cards_per_play': self.cards_per_play,
+            'last_action': self.last_action
+        }
+        
+        # Merge states
+        return {**base_state, **bluff_state}
@@ -1,10 +1,13 @@
-from typing import Dict, Any, Optional, List, Tuple
-from .models import BaseGame, Card, GameState, Player, Rank
+from typing import Dict, Any, Optional, Iterable, List, Tuple
+from .models import RANK_BY_VALUE, RANK_MASK, RANK_ORDINAL, BaseGame, Card, GameState, Player
 
 class GoFishGame(BaseGame):
     def __init__(self, room_code: str):
         super().__init__(room_code)
         self.sets: Dict[str, List[List[Card]]] = {}  # player_id -> list of sets
+        self._hand_by_rank: Dict[str, Dict[int, List[Card]]] = {}  # player_id -> their hand grouped by rank ordinal
+        self._cards_in_play: Optional[int] = None  # Cards in hands or deck, i.e. not yet booked into sets
+        self._sets_cache: Dict[str, Tuple[int, List[List[Dict[str, str]]]]] = {}  # player_id -> (set count, serialized sets)
         self.last_action: Optional[Dict[str, Any]] = None
         self.max_selectable_cards = 1  # Players select one card to ask for
 
@@ -19,28 +22,60 @@ class GoFishGame(BaseGame):
         """Start the game with initial setup"""
         # Initialize sets for each player
         for player in self.players.values():
-            self.sets[str(player.id)] = []
+            self.sets[player.id] = []
         super().start_game()
+        # Rank indexes are rebuilt lazily from the freshly dealt hands
+        self._hand_by_rank = {}
+        self._cards_in_play = self._count_cards_in_play()
+        # Book any sets dealt in the opening hands
+        for player in self.players.values():
+            self._check_for_sets(player)
 
-    def _check_for_sets(self, player: Player) -> List[List[Card]]:
-        """Check and remove any completed sets from player's hand"""
-        # Group cards by rank
-        ranks: Dict[Rank, List[Card]] = {}
-        for card in player.hand:
-            if card.rank not in ranks:
-                ranks[card.rank] = []
-            ranks[card.rank].append(card)
-        
-        # Find and remove sets of four
-        new_sets = []
-        for rank, cards in list(ranks.items()):
-            if len(cards) == 4:
-                new_sets.append(cards)
-                player.hand = [c for c in player.hand if c not in cards]
-                player.score += 1
-        
-        if new_sets:
-            self.sets[str(player.id)].extend(new_sets)
+    def _hand_index_for(self, player: Player) -> Dict[int, List[Card]]:
+        """Get a player's hand grouped by rank ordinal (card.code & RANK_MASK), building it on first use"""
+        by_rank = self._hand_by_rank.get(player.id)
+        if by_rank is None:
+            by_rank = {}
+            for card in player.hand:
+                by_rank.setdefault(card.code & RANK_MASK, []).append(card)
+            self._hand_by_rank[player.id] = by_rank
+        return by_rank
+
+    def _add_to_hand(self, player: Player, cards: List[Card]):
+        """Add cards to a player's hand, keeping its rank index in sync"""
+        by_rank = self._hand_index_for(player)
+        for card in cards:
+            by_rank.setdefault(card.code & RANK_MASK, []).append(card)
+        player.hand.extend(cards)
+
+    def _take_rank_from_hand(self, player: Player, rank_idx: int) -> List[Card]:
+        """Remove and return every card of the given rank ordinal from a player's hand"""
+        cards = self._hand_index_for(player).pop(rank_idx, [])
+        if cards:
+            player.hand = [card for card in player.hand if card.code & RANK_MASK != rank_idx]
+        return cards
+
+    def _check_for_sets(self, player: Player, changed_ranks: Optional[Iterable[int]] = None) -> List[List[Card]]:
+        """Check and remove any completed sets from player's hand.
+
+        Only the rank ordinals in changed_ranks are checked when given; otherwise every rank in the hand is.
+        """
+        by_rank = self._hand_index_for(player)
+        if changed_ranks is None:
+            changed_ranks = list(by_rank)
+        completed = [rank for rank in changed_ranks if len(by_rank.get(rank, ())) == 4]
+        if not completed:
+            return []
+
+        # The index already holds each completed set; drop those ranks from the hand in one pass
+        new_sets = [by_rank.pop(rank) for rank in completed]
+        completed_ranks = set(completed)
+        player.hand = [card for card in player.hand if card.code & RANK_MASK not in completed_ranks]
+
+        player.score += len(new_sets)
+        self.sets[player.id].extend(new_sets)
+        if self._cards_in_play is not None:
+            self._cards_in_play -= 4 * len(new_sets)
         
         return new_sets
 
@@ -50,38 +85,48 @@ class GoFishGame(BaseGame):
             if self.state != GameState.PLAYING:
                 raise ValueError("Game is not in playing state")
 
-            asking_player = self.players.get(str(asking_player_id))
-            target_player = self.players.get(str(target_player_id))
+            players = self.players
+            asking_player = players.get(asking_player_id)
+            target_player = players.get(target_player_id)
 
             if not asking_player or not target_player:
                 raise ValueError("Player not found")
 
-            if str(asking_player.id) != str(self.current_player.id):
-                print(f"Current player: {str(self.current_player.id)}")
-                print(f"Asking player: {str(asking_player.id)}")
-                print(f"Target player: {str(target_player.id)}")
-                print(f"Whose turn is it? {self.current_player.id}")
+            current_player_id = self._current_player_id
+            if asking_player.id != current_player_id:
+                print(f"Current player: {current_player_id}")
+                print(f"Asking player: {asking_player.id}")
+                print(f"Target player: {target_player.id}")
+                print(f"Whose turn is it? {current_player_id}")
                 raise ValueError("Not your turn")
 
-            if str(asking_player.id) == str(target_player.id):
+            if asking_player.id == target_player.id:
                 raise ValueError("Cannot ask yourself for cards")
 
+            # Resolve the requested rank string once; the raw string is kept for last_action
+            rank_enum = RANK_BY_VALUE.get(rank)
+            if rank_enum is None:
+                raise ValueError("Invalid rank")
+            rank_idx = RANK_ORDINAL[rank_enum]
+
+            deck = self.deck
+
             # Check if asking player has a card of the requested rank
-            has_rank = any(card.rank == rank for card in asking_player.hand)
+            has_rank = bool(self._hand_index_for(asking_player).get(rank_idx))
             if not has_rank:
                 # Draw a card if player doesn't have the requested rank
-                drawn_card = self.deck.draw()
+                drawn_card = deck.draw()
                 if drawn_card:
-                    asking_player.hand.append(drawn_card)
+                    self._add_to_hand(asking_player, [drawn_card])
                     # Check for sets after drawing
-                    new_sets = self._check_for_sets(asking_player)
+                    new_sets = self._check_for_sets(asking_player, (drawn_card.code & RANK_MASK,))
                     
                     self.last_action = {
                         'action': 'go_fish',
                         'player': asking_player_id,
                         'rank': rank,
                         'game_state': self.state.value,
-                        'new_sets': [[card.to_dict() for card in set_cards] for set_cards in new_sets]
+                        'new_sets': [set_cards[0].rank.value for set_cards in new_sets]
                     }
                     self.next_turn()
                     return self.get_game_state(asking_player_id)
@@ -95,17 +140,15 @@ class GoFishGame(BaseGame):
                     self.next_turn()
                     return self.get_game_state(asking_player_id)
 
-            # Check if target player has any matching cards
-            matching_cards = [card for card in target_player.hand if card.rank == rank]
+            # Take any matching cards from the target player
+            matching_cards = self._take_rank_from_hand(target_player, rank_idx)
             
             if matching_cards:
                 # Transfer cards
-                for card in matching_cards:
-                    target_player.hand.remove(card)
-                    asking_player.hand.append(card)
+                self._add_to_hand(asking_player, matching_cards)
                 
                 # Check for sets after receiving cards
-                new_sets = self._check_for_sets(asking_player)
+                new_sets = self._check_for_sets(asking_player, (rank_idx,))
                 
                 self.last_action = {
                     'action': 'cards_received',
@@ -113,7 +156,7 @@ class GoFishGame(BaseGame):
                     'target': target_player_id,
                     'rank': rank,
                     'count': len(matching_cards),
-                    'new_sets': [[card.to_dict() for card in set_cards] for set_cards in new_sets],
+                    'new_sets': [set_cards[0].rank.value for set_cards in new_sets],
                     'game_state': self.state.value
                 }
                 
@@ -121,19 +164,19 @@ class GoFishGame(BaseGame):
                 return self.get_game_state(asking_player_id)
             else:
                 # Go fish
-                drawn_card = self.deck.draw()
+                drawn_card = deck.draw()
                 if drawn_card:
-                    asking_player.hand.append(drawn_card)
+                    self._add_to_hand(asking_player, [drawn_card])
                     # Check for sets after drawing
-                    new_sets = self._check_for_sets(asking_player)
+                    new_sets = self._check_for_sets(asking_player, (drawn_card.code & RANK_MASK,))
                     
                     # Check if drawn card matches requested rank
-                    if drawn_card.rank == rank:
+                    if drawn_card.code & RANK_MASK == rank_idx:
                         self.last_action = {
                             'action': 'successful_fish',
                             'player': asking_player_id,
                             'rank': rank,
-                            'new_sets': [[card.to_dict() for card in set_cards] for set_cards in new_sets],
+                            'new_sets': [set_cards[0].rank.value for set_cards in new_sets],
                             'game_state': self.state.value
                         }
                         # Player gets another turn if they drew what they asked for
@@ -143,7 +186,7 @@ class GoFishGame(BaseGame):
                             'action': 'go_fish',
                             'player': asking_player_id,
                             'rank': rank,
-                            'new_sets': [[card.to_dict() for card in set_cards] for set_cards in new_sets],
+                            'new_sets': [set_cards[0].rank.value for set_cards in new_sets],
                             'game_state': self.state.value
                         }
                         # Move to next player since card didn't match
@@ -175,41 +218,56 @@ class GoFishGame(BaseGame):
             # Get base game state
             base_state = super().get_game_state(for_player_id)
             
+            # Build the per-player set views in a single pass over self.sets
+            sets_state = {}
+            scores = {}
+            completed_sets = {}
+            for player_id, sets in self.sets.items():
+                sets_state[player_id] = self._serialize_sets(player_id, sets)
+                scores[player_id] = len(sets)
+                completed_sets[player_id] = [
+                    {'rank': set_cards[0].rank, 'suit': set_cards[0].suit}
+                    for set_cards in sets
+                ]
+            
             # Create go fish specific state
             go_fish_state = {
-                'sets': {
-                    player_id: [[card.to_dict() for card in set_cards] for set_cards in sets]
-                    for player_id, sets in self.sets.items()
-                },
-                'scores': {
-                    player_id: len(sets)
-                    for player_id, sets in self.sets.items()
-                },
-                'completed_sets': {
-                    player_id: [
-                        {'rank': set_cards[0].rank, 'suit': set_cards[0].suit}
-                        for set_cards in sets
-                    ]
-                    for player_id, sets in self.sets.items()
-                },
-                'cards_in_deck': len(self.deck.cards),
+                'sets': sets_state,
+                'scores': scores,
+                'completed_sets': completed_sets,
+                'cards_in_deck': self._cards_in_deck(),
                 'last_action': self.last_action
             }
             
             # Add player's hand if for_player_id is provided
             if for_player_id:
-                player = self.players.get(str(for_player_id))
+                player = self.players.get(for_player_id)
                 if player:
-                    base_state['players'][str(for_player_id)]['hand'] = [card.to_dict() for card in player.hand]
+                    base_state['players'][for_player_id]['hand'] = [card.to_dict() for card in player.hand]
             
             # Merge states and return
-            return {**base_state, **go_fish_state}
+            base_state.update(go_fish_state)
+            return base_state
             
         except Exception as e:
             raise ValueError(f"Failed to get game state: {str(e)}")
 
+    def _serialize_sets(self, player_id: str, sets: List[List[Card]]) -> List[List[Dict[str, str]]]:
+        """Serialize a player's completed sets, reusing the cached result until a new set is booked"""
+        cached = self._sets_cache.get(player_id)
+        if cached is not None and cached[0] == len(sets):
+            return cached[1]
+        serialized = [[card.to_dict() for card in set_cards] for set_cards in sets]
+        self._sets_cache[player_id] = (len(sets), serialized)
+        return serialized
+
+    def _count_cards_in_play(self) -> int:
+        """Count the cards still in hands or the deck"""
+        return sum(len(p.hand) for p in self.players.values()) + len(self.deck.cards)
+
     def _check_game_end(self) -> bool:
         """Check if the game should end"""
         # Game ends when all cards are in sets (no cards in hands or deck)
-        total_cards = sum(len(p.hand) for p in self.players.values()) + len(self.deck.cards)
-        return total_cards == 0
+        if self._cards_in_play is None:
+            self._cards_in_play = self._count_cards_in_play()
+        return self._cards_in_play == 0
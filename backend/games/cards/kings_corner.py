@@ -1,5 +1,25 @@
-from typing import Dict, Any, Optional, List, Tuple
-from .models import BaseGame, Card, GameState, Player, Rank, Suit
+from typing import Callable, Dict, Any, Optional, List, Tuple
+from .models import RANK_MASK, BaseGame, Card, GameState, Player, Rank, Suit
+
+_BLACK_SUITS = frozenset({Suit.CLUBS, Suit.SPADES})
+
+def _accepts_any(card: Card) -> bool:
+    """Placement check for an empty foundation pile"""
+    return True
+
+def _accepts_king(card: Card) -> bool:
+    """Placement check for an empty corner pile"""
+    return card.rank is Rank.KING
+
+def _make_descending_check(top_card: Card) -> Callable[[Card], bool]:
+    """Build the placement check for a pile topped by top_card: one rank lower, opposite color"""
+    next_rank = (top_card.code & RANK_MASK) - 1
+    needs_black = top_card.suit not in _BLACK_SUITS
+
+    def check(card: Card) -> bool:
+        return card.code & RANK_MASK == next_rank and (card.suit in _BLACK_SUITS) == needs_black
+
+    return check
 
 class PileType:
     FOUNDATION = 'foundation'  # Main foundation piles
@@ -10,6 +30,9 @@ class KingsCornerGame(BaseGame):
         super().__init__(room_code)
         self.piles: Dict[str, List[Card]] = {}  # Pile ID to list of cards
         self.pile_types: Dict[str, PileType] = {}  # Pile ID to pile type
+        self._pile_types_snapshot: Dict[str, PileType] = {}  # Copy of pile_types shared by every state broadcast
+        self._pile_checks: Dict[str, Callable[[Card], bool]] = {}  # Pile ID to placement check for its current top
+        self._serialized_piles: Optional[Dict[str, List[Dict[str, str]]]] = None  # Cleared whenever a pile changes
         self.last_action: Optional[Dict[str, Any]] = None
         self.cards_per_hand = 7  # Kings Corner deals 7 cards to each player
 
@@ -20,6 +43,12 @@ class KingsCornerGame(BaseGame):
 
     def _initialize_game_state(self):
         """Initialize Kings Corner-specific state after dealing cards"""
+        self._pile_checks = {}
+        self._serialized_piles = None
+
+        # Kings drawn for a foundation are set aside and returned to the deck afterwards
+        set_aside_kings: List[Card] = []
+
         # Set up foundation piles (4 in center)
         for i in range(4):
             pile_id = f'foundation_{i}'
@@ -31,84 +60,67 @@ class KingsCornerGame(BaseGame):
             if not card:
                 raise ValueError("Not enough cards for foundation piles")
                 
-            # If it's a King, put it back and draw another
+            # If it's a King, set it aside and draw another
             while card.rank == Rank.KING:
-                self.deck.cards.append(card)
-                self.deck.shuffle()
+                set_aside_kings.append(card)
                 card = self.deck.draw()
                 if not card:
                     raise ValueError("Not enough cards for foundation piles")
             
             self.piles[pile_id].append(card)
 
+        # Return set-aside Kings, shuffling once rather than after every rejected draw
+        if set_aside_kings:
+            self.deck.cards.extend(set_aside_kings)
+            self.deck.shuffle()
+
         # Set up corner piles (4 in corners, initially empty)
         for i in range(4):
             pile_id = f'corner_{i}'
             self.piles[pile_id] = []
             self.pile_types[pile_id] = PileType.CORNER
 
-    def _is_card_black(self, card: Card) -> bool:
-        """Check if a card is black (clubs or spades)"""
-        try:
-            return card.suit in [Suit.CLUBS, Suit.SPADES]
-        except Exception as e:
-            raise ValueError(f"Failed to check card color: {str(e)}")
+        # Pile types are fixed from here on, so snapshot them once for get_game_state
+        self._pile_types_snapshot = dict(self.pile_types)
 
-    def _can_place_on_pile(self, card: Card, pile_id: str) -> bool:
-        """Check if a card can be placed on a pile"""
-        try:
-            pile = self.piles[pile_id]
-            pile_type = self.pile_types[pile_id]
-
-            # Empty corner pile can only take Kings
-            if not pile and pile_type == PileType.CORNER:
-                return card.rank == Rank.KING
-
-            # Empty foundation pile can take any card
-            if not pile and pile_type == PileType.FOUNDATION:
-                return True
-
-            # Non-empty pile requires descending rank and alternating color
-            top_card = pile[-1]
-            ranks = list(Rank)
-            return (
-                ranks.index(card.rank) == ranks.index(top_card.rank) - 1 and
-                self._is_card_black(card) != self._is_card_black(top_card)
-            )
-        except Exception as e:
-            raise ValueError(f"Failed to validate card placement: {str(e)}")
+    def _build_pile_check(self, pile_id: str) -> Callable[[Card], bool]:
+        """Build the placement check for a pile's current state"""
+        pile = self.piles[pile_id]
+        pile_type = self.pile_types[pile_id]
 
-    def _can_move_pile(self, source_id: str, target_id: str) -> bool:
-        """Check if one pile can be moved onto another"""
-        try:
-            source_pile = self.piles[source_id]
-            if not source_pile:
-                return False
+        # Empty corner pile can only take Kings
+        if not pile and pile_type == PileType.CORNER:
+            return _accepts_king
 
-            return self._can_place_on_pile(source_pile[0], target_id)
-        except Exception as e:
-            raise ValueError(f"Failed to validate pile movement: {str(e)}")
+        # Empty foundation pile can take any card
+        if not pile and pile_type == PileType.FOUNDATION:
+            return _accepts_any
 
-    def play_card(self, player_id: str, card_index: int, pile_id: str) -> Dict[str, Any]:
-        """Play a card from hand to a pile"""
-        try:
-            if self.state != GameState.PLAYING:
-                raise ValueError("Game is not in playing state")
+        # Non-empty pile requires descending rank and alternating color
+        return _make_descending_check(pile[-1])
 
-            player = self.players.get(str(player_id))
-            if not player:
-                raise ValueError("Player not found")
+    def _pile_changed(self, pile_id: str):
+        """Refresh cached pile data after a pile changes"""
+        self._pile_checks[pile_id] = self._build_pile_check(pile_id)
+        self._serialized_piles = None
 
-            if not self.current_player:
-                raise ValueError("No current player set")
+    def _can_place_on_pile(self, card: Card, pile_id: str) -> bool:
+        """Check if a card can be placed on a pile"""
+        check = self._pile_checks.get(pile_id)
+        if check is None:
+            check = self._pile_checks[pile_id] = self._build_pile_check(pile_id)
+        return check(card)
 
-            if player.id != self.current_player.id:
-                raise ValueError("Not your turn")
+    def play_card(self, player_id: str, card_index: int, pile_id: str) -> Dict[str, Any]:
+        """Play a card from hand to a pile"""
+        try:
+            player = self._require_current_player(player_id)
 
             if card_index < 0 or card_index >= len(player.hand):
                 raise ValueError("Invalid card index")
 
-            if pile_id not in self.piles:
+            pile = self.piles.get(pile_id)
+            if pile is None:
                 raise ValueError("Invalid pile")
 
             card = player.hand[card_index]
@@ -117,7 +129,8 @@ class KingsCornerGame(BaseGame):
 
             # Move card from hand to pile
             player.hand.pop(card_index)
-            self.piles[pile_id].append(card)
+            pile.append(card)
+            self._pile_changed(pile_id)
 
             self.last_action = {
                 'action': 'card_played',
@@ -133,7 +146,7 @@ class KingsCornerGame(BaseGame):
                 player.score += 1  # Winner gets a point
                 self.last_action.update({
                     'game_state': self.state.value,
-                    'winner': str(player.id)
+                    'winner': player.id
                 })
 
             return self.last_action
@@ -143,36 +156,29 @@ class KingsCornerGame(BaseGame):
     def move_pile(self, player_id: str, source_pile_id: str, target_pile_id: str) -> Dict[str, Any]:
         """Move an entire pile onto another pile"""
         try:
-            if self.state != GameState.PLAYING:
-                raise ValueError("Game is not in playing state")
-
-            player = self.players.get(str(player_id))
-            if not player:
-                raise ValueError("Player not found")
-
-            if not self.current_player:
-                raise ValueError("No current player set")
+            player = self._require_current_player(player_id)
 
-            if player.id != self.current_player.id:
-                raise ValueError("Not your turn")
-
-            if source_pile_id not in self.piles or target_pile_id not in self.piles:
+            source_cards = self.piles.get(source_pile_id)
+            target_cards = self.piles.get(target_pile_id)
+            if source_cards is None or target_cards is None:
                 raise ValueError("Invalid pile")
 
-            if not self._can_move_pile(source_pile_id, target_pile_id):
+            if not source_cards or not self._can_place_on_pile(source_cards[0], target_pile_id):
                 raise ValueError("Invalid move")
 
-            # Move all cards from source to target
-            source_cards = self.piles[source_pile_id]
-            self.piles[target_pile_id].extend(source_cards)
-            self.piles[source_pile_id] = []
+            # Move all cards from source to target; the pile contents go out with the next state
+            moved_count = len(source_cards)
+            target_cards.extend(source_cards)
+            source_cards.clear()
+            self._pile_changed(source_pile_id)
+            self._pile_changed(target_pile_id)
 
             self.last_action = {
                 'action': 'pile_moved',
                 'player': player.id,
                 'source_pile': source_pile_id,
                 'target_pile': target_pile_id,
-                'cards': [card.to_dict() for card in source_cards],
+                'card_count': moved_count,
                 'game_state': self.state.value
             }
 
@@ -183,18 +189,7 @@ class KingsCornerGame(BaseGame):
     def draw_card(self, player_id: str) -> Dict[str, Any]:
         """Draw a card from the deck"""
         try:
-            if self.state != GameState.PLAYING:
-                raise ValueError("Game is not in playing state")
-
-            player = self.players.get(str(player_id))
-            if not player:
-                raise ValueError("Player not found")
-
-            if not self.current_player:
-                raise ValueError("No current player set")
-
-            if player.id != self.current_player.id:
-                raise ValueError("Not your turn")
+            player = self._require_current_player(player_id)
 
             card = self.deck.draw()
             if not card:
@@ -218,18 +213,7 @@ class KingsCornerGame(BaseGame):
     def end_turn(self, player_id: str) -> Dict[str, Any]:
         """End the current player's turn"""
         try:
-            if self.state != GameState.PLAYING:
-                raise ValueError("Game is not in playing state")
-
-            player = self.players.get(str(player_id))
-            if not player:
-                raise ValueError("Player not found")
-
-            if not self.current_player:
-                raise ValueError("No current player set")
-
-            if player.id != self.current_player.id:
-                raise ValueError("Not your turn")
+            player = self._require_current_player(player_id)
 
             self.last_action = {
                 'action': 'turn_ended',
@@ -244,6 +228,15 @@ class KingsCornerGame(BaseGame):
         except Exception as e:
             raise ValueError(f"Failed to end turn: {str(e)}")
 
+    def _get_serialized_piles(self) -> Dict[str, List[Dict[str, str]]]:
+        """Serialize all piles, reusing the previous result until a pile changes"""
+        if self._serialized_piles is None:
+            self._serialized_piles = {
+                pile_id: [card.to_dict() for card in pile]
+                for pile_id, pile in self.piles.items()
+            }
+        return self._serialized_piles
+
     def get_game_state(self, for_player_id: Optional[str] = None) -> Dict[str, Any]:
         """Get the current game state"""
         try:
@@ -252,17 +245,15 @@ class KingsCornerGame(BaseGame):
             
             # Create kings corner specific state
             kings_corner_state = {
-                'piles': {
-                    pile_id: [card.to_dict() for card in pile]
-                    for pile_id, pile in self.piles.items()
-                },
-                'pile_types': self.pile_types.copy(),
-                'cards_in_deck': len(self.deck.cards),
+                'piles': self._get_serialized_piles(),
+                'pile_types': self._pile_types_snapshot,
+                'cards_in_deck': self._cards_in_deck(),
                 'last_action': self.last_action
             }
             
             # Merge states
-            return {**base_state, **kings_corner_state}
+            base_state.update(kings_corner_state)
+            return base_state
             
         except Exception as e:
             # Return minimal valid state on error
@@ -1,7 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import random
-from typing import List, Optional, Dict, Any, ForwardRef
+from typing import List, Optional, Dict, Any, ClassVar, ForwardRef, Tuple
 
 Player = ForwardRef('Player')
 
@@ -26,39 +26,63 @@ class Rank(Enum):
     QUEEN = 'Q'
     KING = 'K'
 
-@dataclass
+# Lookup from a rank's string value (e.g. 'Q') to the Rank member
+RANK_BY_VALUE: Dict[str, Rank] = {r.value: r for r in Rank}
+
+# Position of each rank (Ace = 0 ... King = 12) and suit in declaration order
+RANK_ORDINAL: Dict[Rank, int] = {r: i for i, r in enumerate(Rank)}
+SUIT_ORDINAL: Dict[Suit, int] = {s: i for i, s in enumerate(Suit)}
+
+# Point value of each rank: Ace is 11, face cards are 10, the rest are their number
+RANK_VALUES: Dict[Rank, int] = {r: 11 if r == Rank.ACE else 10 if r in (Rank.JACK, Rank.QUEEN, Rank.KING) else int(r.value) for r in Rank}
+
+# Card.code layout: rank ordinal in the low nibble, suit ordinal above it
+RANK_MASK = 0x0F
+SUIT_SHIFT = 4
+
+# Front image path of every card, keyed by Card.code
+IMAGE_FRONT_BY_CODE: Dict[int, str] = {
+    RANK_ORDINAL[r] | (SUIT_ORDINAL[s] << SUIT_SHIFT): f"assets/{s.value}_{r.value}.png"
+    for s in Suit for r in Rank
+}
+
+@dataclass(slots=True)
 class Card:
     rank: Rank
     suit: Suit
+    code: int = field(init=False, repr=False, compare=False)  # Packed rank/suit ordinals, see RANK_MASK/SUIT_SHIFT
+    value: int = field(init=False, repr=False, compare=False)  # Numerical value, see RANK_VALUES (Ace is 11 here; it can be 1 in some games)
+    _dict: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)  # Cached to_dict() result
 
-    @property
-    def value(self) -> int:
-        """Get the numerical value of the card"""
-        if self.rank == Rank.ACE:
-            return 11  # Can be 1 in some games
-        elif self.rank in [Rank.JACK, Rank.QUEEN, Rank.KING]:
-            return 10
-        else:
-            return int(self.rank.value)
+    # Path to the card's back image, the same for every card
+    image_back: ClassVar[str] = "assets/back_dark.png"
+
+    def __post_init__(self):
+        self.code = RANK_ORDINAL[self.rank] | (SUIT_ORDINAL[self.suit] << SUIT_SHIFT)
+        self.value = RANK_VALUES[self.rank]
 
     @property
     def image_front(self) -> str:
         """Get the path to the card's front image"""
-        return f"assets/{self.suit.value}_{self.rank.value}.png"
-
-    @property
-    def image_back(self) -> str:
-        """Get the path to the card's back image"""
-        return "assets/back_dark.png"
+        return IMAGE_FRONT_BY_CODE[self.code]
 
     def to_dict(self) -> Dict[str, str]:
-        """Convert card to dictionary for JSON serialization"""
-        return {
-            'rank': self.rank.value,
-            'suit': self.suit.value,
-            'image_front': self.image_front,
-            'image_back': self.image_back
-        }
+        """Convert card to dictionary for JSON serialization.
+
+        The dict is computed once and shared between calls, so repeat calls allocate nothing - copy it before modifying.
+        """
+        card_dict = self._dict
+        if card_dict is None:
+            card_dict = self._dict = {
+                'rank': self.rank.value,
+                'suit': self.suit.value,
+                'image_front': self.image_front,
+                'image_back': self.image_back
+            }
+        return card_dict
+
+# Every card in a standard deck; cards are never mutated, so decks share these instances
+_DECK_TEMPLATE = tuple(Card(rank, suit) for suit in Suit for rank in Rank)
 
 class Deck:
     def __init__(self):
@@ -66,12 +90,9 @@ class Deck:
         
     def create_deck(self):
         """Create a deck of 52 cards"""
-        for suit in Suit:
-            for rank in Rank:
-                self.cards.append(Card(rank, suit))
+        self.cards = list(_DECK_TEMPLATE)
         self.shuffle()
         if len(self.cards) != 52:
-            print(f"Deck initialization error: {len(self.cards)} cards instead of 52")
             raise ValueError(f"Deck initialization error: {len(self.cards)} cards instead of 52")
     
     def reset(self):
@@ -82,7 +103,8 @@ class Deck:
     
     def shuffle(self):
         """Shuffle the deck"""
-        random.shuffle(self.cards)
+        # Sorting on random keys gives a uniform shuffle with the loop in C, unlike random.shuffle
+        self.cards.sort(key=lambda _: random.random())
 
     def draw(self) -> Optional[Card]:
         """Draw a card from the deck"""
@@ -92,30 +114,28 @@ class Deck:
         """Draw multiple cards from the deck"""
         if count > len(self.cards):
             raise ValueError("Not enough cards to deal")
-        drawn = []
-        for _ in range(count):
-            card = self.draw()
-            if card:
-                drawn.append(card)
+        return self._draw_from_top(count)
+
+    def _draw_from_top(self, count: int) -> List[Card]:
+        """Remove the top count cards in one slice, returned in the order draw() would give them"""
+        start = len(self.cards) - count
+        drawn = self.cards[start:]
+        del self.cards[start:]
+        drawn.reverse()
         return drawn
 
     def deal(self, players: List[Player], cards_per_player: int) -> None:
         """Deal cards to players"""
         total_cards_needed = len(players) * cards_per_player
         if total_cards_needed > len(self.cards):
-            print(f"Deck initialization error: {len(self.cards)} cards instead of 52")
             raise ValueError(f"Not enough cards to deal. Need {total_cards_needed}, have {len(self.cards)}")
             
-        # Deal cards one at a time to each player
-        for _ in range(cards_per_player):
-            for player in players:
-                card = self.draw()
-                if not card:  # This shouldn't happen since we checked counts
-                    print(f"Deck initialization error: {len(self.cards)} cards instead of 52")
-                    raise ValueError("Unexpected error: ran out of cards while dealing")
-                player.hand.append(card)
-
-@dataclass
+        # Deal cards one at a time to each player, in the same order as drawing them one by one
+        num_players = len(players)
+        for i, card in enumerate(self._draw_from_top(total_cards_needed)):
+            players[i % num_players].hand.append(card)
+
+@dataclass(slots=True)
 class Player:
     id: str
     name: str
@@ -124,6 +144,10 @@ class Player:
     is_ready: bool = False
     is_host: bool = False
 
+    def __post_init__(self):
+        # Normalize IDs once so games can compare and key on them without str() calls
+        self.id = str(self.id)
+
     def to_dict(self, hide_hand: bool = False) -> Dict[str, Any]:
         """Convert player to dictionary for JSON serialization"""
         player_dict = {
@@ -153,17 +177,27 @@ class BaseGame:
     def __init__(self, room_code: str):
         self.room_code = room_code
         self.players: Dict[str, Player] = {}
-        self.deck = Deck()
-        self.deck.create_deck()  # Initialize deck with 52 cards
+        self._num_players = 0  # len(self.players), kept in sync by add_player/remove_player
+        self._player_order: Optional[List[Player]] = None  # Cached player_order, reset by add_player/remove_player
+        self._host_id: Optional[str] = None  # Id of the first host in player_order, kept in sync by add_player/remove_player
+        self._hand_views: Dict[str, Tuple[Tuple[Card, ...], Dict[Optional[bool], List[Dict[str, Any]]]]] = {}  # player_id -> (hand snapshot, serialized hand by show_back)
+        self.deck = Deck()  # Filled with 52 cards by start_game
         self.state = GameState.WAITING
+        self._current_player_id: Optional[str] = None  # Id of the player at current_player_idx, kept in sync by its setter
         self.current_player_idx = 0
         self.direction = 1  # 1 for clockwise, -1 for counter-clockwise
         self.max_selectable_cards = 0  # Default to 0 - most games don't need card selection
 
     @property
     def player_order(self) -> List[Player]:
-        """Get list of players in turn order"""
-        return list(self.players.values())
+        """Get list of players in turn order.
+
+        The list is cached and shared between calls - copy it before modifying.
+        """
+        order = self._player_order
+        if order is None:
+            order = self._player_order = list(self.players.values())
+        return order
 
     @property
     def current_player(self) -> Optional[Player]:
@@ -171,16 +205,54 @@ class BaseGame:
         players = self.player_order
         return players[self.current_player_idx] if players else None
 
+    @property
+    def current_player_idx(self) -> int:
+        """Index of the current player in player_order"""
+        return self._current_player_idx
+
+    @current_player_idx.setter
+    def current_player_idx(self, idx: int):
+        self._current_player_idx = idx
+        self._sync_current_player_id()
+
+    def _sync_current_player_id(self):
+        """Refresh the cached id of the player whose turn it is"""
+        players = self.player_order
+        if -len(players) <= self._current_player_idx < len(players):
+            self._current_player_id = players[self._current_player_idx].id
+        else:
+            self._current_player_id = None
+
     def add_player(self, player_id: str, name: str, is_host: bool = False) -> Player:
         """Add a player to the game"""
         player = Player(id=player_id, name=name, hand=[], is_host=is_host)
-        self.players[player_id] = player
+        self.players[player.id] = player
+        self._num_players = len(self.players)
+        self._player_order = None
+        self._sync_current_player_id()
+        self._sync_host_id()
         return player
 
     def remove_player(self, player_id: str):
         """Remove a player from the game"""
         if player_id in self.players:
             del self.players[player_id]
+            self._num_players = len(self.players)
+            self._player_order = None
+            self._hand_views.pop(player_id, None)
+            self._sync_current_player_id()
+            self._sync_host_id()
+
+    def _sync_host_id(self):
+        """Refresh the cached host id after the roster changes"""
+        host_player = next((p for p in self.player_order if p.is_host), None)
+        self._host_id = host_player.id if host_player else None
+
+    def _cards_in_deck(self) -> int:
+        """Number of cards left in the deck, reporting a full deck while waiting since it is only built by start_game"""
+        if self.state == GameState.WAITING:
+            return len(_DECK_TEMPLATE)
+        return len(self.deck.cards)
 
     def start_game(self):
         """Start the game"""
@@ -190,8 +262,7 @@ class BaseGame:
         try:
             self.state = GameState.STARTING
             # Reset deck and validate card count
-            self.deck = Deck()  # Create a fresh deck
-            self.deck.create_deck()  # Initialize with 52 cards
+            self.deck.reset()  # Fresh shuffled 52-card deck
             total_cards = len(self.deck.cards)
             if total_cards != 52:
                 raise ValueError(f"Invalid deck size: {total_cards} cards instead of 52")
@@ -224,6 +295,29 @@ class BaseGame:
             self.state = GameState.WAITING
             raise ValueError(f"Failed to start game: {str(e)}")
     
+    def _require_player(self, player_id: str) -> Player:
+        """Get a player by id, raising ValueError if they are not in the game"""
+        try:
+            return self.players[player_id]
+        except KeyError:
+            raise ValueError("Player not found")
+
+    def _require_current_player(self, player_id: str) -> Player:
+        """Get the player making a turn action, raising ValueError unless the game is playing and it is their turn"""
+        if self.state != GameState.PLAYING:
+            raise ValueError("Game is not in playing state")
+
+        player = self._require_player(player_id)
+
+        current_player_id = self._current_player_id
+        if current_player_id is None:
+            raise ValueError("No current player set")
+
+        if player.id != current_player_id:
+            raise ValueError("Not your turn")
+
+        return player
+
     def _calculate_min_cards_needed(self) -> int:
         """Calculate minimum cards needed based on number of players"""
         # Default implementation - override in specific games
@@ -231,37 +325,46 @@ class BaseGame:
 
     def next_turn(self):
         """Advance to the next player's turn"""
-        self.current_player_idx = (self.current_player_idx + self.direction) % len(self.players)
+        self.current_player_idx = (self.current_player_idx + self.direction) % self._num_players
+
+    def _hand_view(self, player: Player, show_back: Optional[bool]) -> List[Dict[str, Any]]:
+        """Get a player's serialized hand, with show_back flags unless show_back is None.
+
+        Views are reused until the hand's cards change and are shared between calls - copy before modifying.
+        """
+        cards = tuple(player.hand)
+        cached = self._hand_views.get(player.id)
+        if cached is None or cached[0] != cards:
+            cached = self._hand_views[player.id] = (cards, {})
+        views = cached[1]
+        view = views.get(show_back)
+        if view is None:
+            if show_back is None:
+                view = [card.to_dict() for card in cards]
+            else:
+                view = [{**card.to_dict(), 'show_back': show_back} for card in cards]
+            views[show_back] = view
+        return view
 
     def get_game_state(self, for_player_id: Optional[str] = None) -> Dict[str, Any]:
         """Get the current game state"""
         try:
-            # Find the host player
-            host_player = next((p for p in self.players.values() if p.is_host), None)
-            host_id = host_player.id if host_player else None
+            host_id = self._host_id
             
             # Convert players to dict
             players_dict = {}
-            for player in self.player_order:
-                # Get the full player dict with their cards
-                player_dict = player.to_dict(hide_hand=False)
+            for player in self.players.values():
+                player_dict = player.to_dict(hide_hand=True)
                 
-                # If we're getting state for a specific player, add show_back flags
-                if for_player_id is not None:
-                    # Deep copy the hand array to avoid modifying the original card dicts
-                    hand_copy = []
-                    for card in player_dict['hand']:
-                        card_copy = card.copy()
-                        # Only add show_back=true for other players' cards
-                        card_copy['show_back'] = str(player.id) != str(for_player_id)
-                        hand_copy.append(card_copy)
-                    player_dict['hand'] = hand_copy
+                # If we're getting state for a specific player, add show_back flags;
+                # only other players' cards get show_back=true
+                show_back = None if for_player_id is None else player.id != str(for_player_id)
+                player_dict['hand'] = self._hand_view(player, show_back)
                 
                 players_dict[str(player.id)] = player_dict
             
             # Get current player safely
-            current_player = self.current_player
-            current_player_id = current_player.id if current_player else None
+            current_player_id = self._current_player_id
             
             game_state = {
                 'room_code': self.room_code,
@@ -269,7 +372,7 @@ class BaseGame:
                 'host_id': host_id,
                 'players': players_dict,
                 'current_player': current_player_id,
-                'deck': {'cards_remaining': len(self.deck.cards)},  # Only send count, not actual cards
+                'deck': {'cards_remaining': self._cards_in_deck()},  # Only send count, not actual cards
                 'direction': self.direction,
                 'current_player_idx': self.current_player_idx,
                 'max_selectable_cards': self.max_selectable_cards  # Add max_selectable_cards to game state
@@ -1,5 +1,5 @@
 from typing import Dict, Any, Optional, List, Set, Tuple
-from .models import BaseGame, Card, GameState, Player, Rank, Suit
+from .models import RANK_MASK, SUIT_SHIFT, BaseGame, Card, GameState, Player
 
 class RummyGame(BaseGame):
     def __init__(self, room_code: str):
@@ -7,6 +7,7 @@ class RummyGame(BaseGame):
         self.discard_pile: List[Card] = []
         self.last_action: Optional[Dict[str, Any]] = None
         self.melds: Dict[str, List[List[Card]]] = {}  # Player ID to list of melds
+        self._melds_cache: Dict[str, Tuple[Tuple[int, int], List[List[Dict[str, str]]]]] = {}  # player_id -> ((meld count, card count), serialized melds)
         self.cards_per_hand = 7  # Standard Rummy deals 7 cards
         self.max_selectable_cards = 7  # Players can lay down melds of up to 7 cards
 
@@ -18,8 +19,8 @@ class RummyGame(BaseGame):
     def _initialize_game_state(self):
         """Initialize Rummy-specific state after dealing cards"""
         # Initialize melds for each player
-        for player in self.players.values():
-            self.melds[str(player.id)] = []
+        self.melds = {player_id: [] for player_id in self.players}
+        self._melds_cache = {}
 
         # Start discard pile
         first_card = self.deck.draw()
@@ -29,62 +30,61 @@ class RummyGame(BaseGame):
 
     def _is_valid_run(self, cards: List[Card]) -> bool:
         """Check if cards form a valid run (sequential cards of same suit)"""
-        if len(cards) < 3:
+        # A run is at least 3 cards and can't be longer than the 13 ranks
+        if not 3 <= len(cards) <= 13:
             return False
 
-        try:
-            # Sort by rank value
-            sorted_cards = sorted(cards, key=lambda c: c.value)
-            
-            # Check all cards are same suit
-            suit = sorted_cards[0].suit
-            if not all(card.suit == suit for card in sorted_cards):
-                return False
+        # One bit per rank ordinal and per suit ordinal, from the packed card codes
+        rank_bits = suit_bits = 0
+        for card in cards:
+            rank_bits |= 1 << (card.code & RANK_MASK)
+            suit_bits |= 1 << (card.code >> SUIT_SHIFT)
 
-            # Check ranks are sequential
-            ranks = list(Rank)
-            for i in range(len(sorted_cards) - 1):
-                curr_idx = ranks.index(sorted_cards[i].rank)
-                next_idx = ranks.index(sorted_cards[i + 1].rank)
-                if next_idx != curr_idx + 1:
-                    return False
+        # Check all cards are same suit
+        if suit_bits & (suit_bits - 1):
+            return False
 
-            return True
-        except Exception as e:
-            raise ValueError(f"Failed to validate run: {str(e)}")
+        # Check ranks are sequential (Ace low): shifted down to bit 0 they must be exactly len(cards) ones,
+        # which also rules out repeated ranks
+        return rank_bits // (rank_bits & -rank_bits) == (1 << len(cards)) - 1
 
     def _is_valid_set(self, cards: List[Card]) -> bool:
         """Check if cards form a valid set (same rank, different suits)"""
-        if len(cards) < 3:
+        # A set is at least 3 cards and can't be larger than the 4 suits
+        if not 3 <= len(cards) <= 4:
             return False
 
-        try:
-            # Check all cards are same rank
-            rank = cards[0].rank
-            if not all(card.rank == rank for card in cards):
+        # Check all cards are same rank
+        rank_idx = cards[0].code & RANK_MASK
+        suit_bits = 0
+        for card in cards:
+            if card.code & RANK_MASK != rank_idx:
                 return False
+            suit_bits |= 1 << (card.code >> SUIT_SHIFT)
 
-            # Check all suits are different
-            suits = {card.suit for card in cards}
-            return len(suits) == len(cards)
-        except Exception as e:
-            raise ValueError(f"Failed to validate set: {str(e)}")
+        # Check all suits are different
+        return suit_bits.bit_count() == len(cards)
 
-    def draw_card(self, player_id: str, from_discard: bool = False) -> Dict[str, Any]:
-        """Draw a card from either the deck or discard pile"""
-        try:
-            if self.state != GameState.PLAYING:
-                raise ValueError("Game is not in playing state")
+    def _can_extend_meld(self, meld: List[Card], card: Card) -> bool:
+        """Check if a card can be added to a meld that is already a valid run or set"""
+        first_code = meld[0].code
+        code = card.code
+        rank_idx = code & RANK_MASK
 
-            player = self.players.get(str(player_id))
-            if not player:
-                raise ValueError("Player not found")
+        # A valid meld whose first two cards share a rank is a set: the card needs that rank and a new suit
+        if meld[1].code & RANK_MASK == first_code & RANK_MASK:
+            return rank_idx == first_code & RANK_MASK and all(c.code != code for c in meld)
 
-            if not self.current_player:
-                raise ValueError("No current player set")
+        # Otherwise it is a run: the card needs the run's suit and must extend either end
+        if code >> SUIT_SHIFT != first_code >> SUIT_SHIFT:
+            return False
+        rank_indices = [c.code & RANK_MASK for c in meld]
+        return rank_idx == max(rank_indices) + 1 or rank_idx == min(rank_indices) - 1
 
-            if player.id != self.current_player.id:
-                raise ValueError("Not your turn")
+    def draw_card(self, player_id: str, from_discard: bool = False) -> Dict[str, Any]:
+        """Draw a card from either the deck or discard pile"""
+        try:
+            player = self._require_current_player(player_id)
 
             if from_discard:
                 if not self.discard_pile:
@@ -95,9 +95,11 @@ class RummyGame(BaseGame):
                 if not card:
                     # Reshuffle discard pile if deck is empty
                     if len(self.discard_pile) > 1:  # Keep top card
-                        self.deck.cards = self.discard_pile[:-1]
+                        top_card = self.discard_pile.pop()
+                        self.deck.cards.extend(self.discard_pile)
+                        self.discard_pile.clear()
+                        self.discard_pile.append(top_card)
                         self.deck.shuffle()
-                        self.discard_pile = [self.discard_pile[-1]]
                         card = self.deck.draw()
                     if not card:
                         raise ValueError("No cards left to draw")
@@ -119,18 +121,7 @@ class RummyGame(BaseGame):
     def discard_card(self, player_id: str, card_index: int) -> Dict[str, Any]:
         """Discard a card from hand"""
         try:
-            if self.state != GameState.PLAYING:
-                raise ValueError("Game is not in playing state")
-
-            player = self.players.get(str(player_id))
-            if not player:
-                raise ValueError("Player not found")
-
-            if not self.current_player:
-                raise ValueError("No current player set")
-
-            if player.id != self.current_player.id:
-                raise ValueError("Not your turn")
+            player = self._require_current_player(player_id)
 
             if card_index < 0 or card_index >= len(player.hand):
                 raise ValueError("Invalid card index")
@@ -158,18 +149,7 @@ class RummyGame(BaseGame):
     def lay_meld(self, player_id: str, card_indices: List[int]) -> Dict[str, Any]:
         """Lay down a meld (set or run)"""
         try:
-            if self.state != GameState.PLAYING:
-                raise ValueError("Game is not in playing state")
-
-            player = self.players.get(str(player_id))
-            if not player:
-                raise ValueError("Player not found")
-
-            if not self.current_player:
-                raise ValueError("No current player set")
-
-            if player.id != self.current_player.id:
-                raise ValueError("Not your turn")
+            player = self._require_current_player(player_id)
 
             if not card_indices or len(card_indices) < 3:
                 raise ValueError("Must use at least 3 cards")
@@ -181,19 +161,20 @@ class RummyGame(BaseGame):
             cards = [player.hand[i] for i in sorted(card_indices)]
 
             # Validate meld
-            if not (self._is_valid_run(cards) or self._is_valid_set(cards)):
+            is_run = self._is_valid_run(cards)
+            if not (is_run or self._is_valid_set(cards)):
                 raise ValueError("Cards do not form a valid meld")
 
-            # Remove cards from hand and add to melds
-            for i in sorted(card_indices, reverse=True):
-                player.hand.pop(i)
-            self.melds[str(player.id)].append(cards)
+            # Remove cards from hand in one pass and add to melds
+            used_indices = set(card_indices)
+            player.hand = [card for i, card in enumerate(player.hand) if i not in used_indices]
+            self.melds[player.id].append(cards)
 
             self.last_action = {
                 'action': 'meld_laid',
                 'player': player.id,
                 'cards': [card.to_dict() for card in cards],
-                'meld_type': 'run' if self._is_valid_run(cards) else 'set',
+                'meld_type': 'run' if is_run else 'set',
                 'game_state': self.state.value
             }
 
@@ -203,7 +184,7 @@ class RummyGame(BaseGame):
                 player.score += 1  # Winner gets a point
                 self.last_action.update({
                     'game_state': self.state.value,
-                    'winner': str(player.id)
+                    'winner': player.id
                 })
 
             return self.last_action
@@ -213,37 +194,25 @@ class RummyGame(BaseGame):
     def add_to_meld(self, player_id: str, card_index: int, meld_index: int) -> Dict[str, Any]:
         """Add a card to an existing meld"""
         try:
-            if self.state != GameState.PLAYING:
-                raise ValueError("Game is not in playing state")
-
-            player = self.players.get(str(player_id))
-            if not player:
-                raise ValueError("Player not found")
-
-            if not self.current_player:
-                raise ValueError("No current player set")
-
-            if player.id != self.current_player.id:
-                raise ValueError("Not your turn")
+            player = self._require_current_player(player_id)
 
             if card_index < 0 or card_index >= len(player.hand):
                 raise ValueError("Invalid card index")
 
-            if meld_index < 0 or meld_index >= len(self.melds[str(player.id)]):
+            if meld_index < 0 or meld_index >= len(self.melds[player.id]):
                 raise ValueError("Invalid meld index")
 
             # Get card and meld
             card = player.hand[card_index]
-            meld = self.melds[str(player.id)][meld_index]
+            meld = self.melds[player.id][meld_index]
 
             # Try adding card to meld
-            test_meld = meld + [card]
-            if not (self._is_valid_run(test_meld) or self._is_valid_set(test_meld)):
+            if not self._can_extend_meld(meld, card):
                 raise ValueError("Card cannot be added to meld")
 
             # Remove card from hand and add to meld
             player.hand.pop(card_index)
-            self.melds[str(player.id)][meld_index].append(card)
+            self.melds[player.id][meld_index].append(card)
 
             self.last_action = {
                 'action': 'card_added_to_meld',
@@ -259,7 +228,7 @@ class RummyGame(BaseGame):
                 player.score += 1  # Winner gets a point
                 self.last_action.update({
                     'game_state': self.state.value,
-                    'winner': str(player.id)
+                    'winner': player.id
                 })
 
             return self.last_action
@@ -272,31 +241,22 @@ class RummyGame(BaseGame):
             # Get base game state
             base_state = super().get_game_state(for_player_id)
             
-            # Get discard pile top safely
-            discard_top = None
-            try:
-                if self.discard_pile:
-                    discard_top = self.discard_pile[-1].to_dict()
-            except Exception:
-                # If there's any error getting discard top, leave it as None
-                pass
+            discard_top = self.discard_pile[-1].to_dict() if self.discard_pile else None
             
             # Create rummy specific state
             rummy_state = {
                 'discard_pile_top': discard_top,
-                'cards_in_deck': len(self.deck.cards),
+                'cards_in_deck': self._cards_in_deck(),
                 'melds': {
-                    player_id: [
-                        [card.to_dict() for card in meld]
-                        for meld in player_melds
-                    ]
+                    player_id: self._serialize_melds(player_id, player_melds)
                     for player_id, player_melds in self.melds.items()
                 },
                 'last_action': self.last_action
             }
             
             # Merge states
-            return {**base_state, **rummy_state}
+            base_state.update(rummy_state)
+            return base_state
             
         except Exception as e:
             # Return minimal valid state on error
@@ -315,6 +275,17 @@ class RummyGame(BaseGame):
                 'error': str(e)
             }
 
+    def _serialize_melds(self, player_id: str, melds: List[List[Card]]) -> List[List[Dict[str, str]]]:
+        """Serialize a player's melds, reusing the cached result until a meld is laid or extended"""
+        # Melds only ever grow, so the meld and card counts identify their contents
+        key = (len(melds), sum(len(meld) for meld in melds))
+        cached = self._melds_cache.get(player_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        serialized = [[card.to_dict() for card in meld] for meld in melds]
+        self._melds_cache[player_id] = (key, serialized)
+        return serialized
+
     def start_game(self):
         """Start a new game"""
         try:
@@ -1,5 +1,5 @@
 from typing import Dict, Any, Optional, List, Tuple
-from .models import BaseGame, Card, GameState, Player, Rank, Suit
+from .models import SUIT_SHIFT, BaseGame, Card, GameState, Player
 
 class ScatGame(BaseGame):
     def __init__(self, room_code: str):
@@ -9,6 +9,7 @@ class ScatGame(BaseGame):
         self.knocked_player_id: Optional[str] = None  # ID of player who knocked
         self.final_round = False  # True when someone knocks
         self.lives: Dict[str, int] = {}  # Player ID to number of lives (usually 3)
+        self._lives_snapshot: Optional[Dict[str, int]] = None  # Copy of lives shared by states and actions, reset whenever lives change
         self.INITIAL_LIVES = 3
         self.max_selectable_cards = 1  # Players select one card to discard
 
@@ -20,8 +21,8 @@ class ScatGame(BaseGame):
     def start_game(self):
         """Start the game with initial setup"""
         # Initialize lives for each player
-        for player in self.players.values():
-            self.lives[str(player.id)] = self.INITIAL_LIVES
+        self.lives = dict.fromkeys(self.players, self.INITIAL_LIVES)
+        self._lives_snapshot = None
         
         super().start_game()
         
@@ -33,178 +34,137 @@ class ScatGame(BaseGame):
 
     def _calculate_hand_value(self, hand: List[Card]) -> int:
         """Calculate the highest value possible in a single suit"""
-        try:
-            # Group cards by suit
-            suits: Dict[Suit, List[Card]] = {}
-            for card in hand:
-                if card.suit not in suits:
-                    suits[card.suit] = []
-                suits[card.suit].append(card)
-
-            # Calculate value for each suit
-            max_value = 0
-            for suit_cards in suits.values():
-                value = sum(card.value for card in suit_cards)
-                max_value = max(max_value, value)
-
-            return min(max_value, 31)  # Cap at 31
-        except Exception as e:
-            raise ValueError(f"Failed to calculate hand value: {str(e)}")
+        # Total the card values for each suit, indexed by suit ordinal
+        totals = [0, 0, 0, 0]
+        for card in hand:
+            totals[card.code >> SUIT_SHIFT] += card.value
+
+        return min(max(totals), 31)  # Cap at 31
 
     def draw_card(self, player_id: str, from_discard: bool = False) -> Dict[str, Any]:
         """Draw a card from either the deck or discard pile"""
-        try:
-            if self.state != GameState.PLAYING:
-                raise ValueError("Game is not in playing state")
-
-            player = self.players.get(str(player_id))
-            if not player:
-                raise ValueError("Player not found")
-
-            if not self.current_player:
-                raise ValueError("No current player set")
-
-            if player.id != self.current_player.id:
-                raise ValueError("Not your turn")
-
-            if len(player.hand) > 3:
-                raise ValueError("Already have maximum cards")
-
-            if from_discard:
-                if not self.discard_pile:
-                    raise ValueError("Discard pile is empty")
-                card = self.discard_pile.pop()
-            else:
-                card = self.deck.draw()
+        player = self._require_current_player(player_id)
+
+        if len(player.hand) > 3:
+            raise ValueError("Already have maximum cards")
+
+        if from_discard:
+            if not self.discard_pile:
+                raise ValueError("Discard pile is empty")
+            card = self.discard_pile.pop()
+        else:
+            card = self.deck.draw()
+            if not card:
+                # Reshuffle discard pile if deck is empty
+                if len(self.discard_pile) > 1:  # Keep top card
+                    top_card = self.discard_pile.pop()
+                    self.deck.cards.extend(self.discard_pile)
+                    self.discard_pile.clear()
+                    self.discard_pile.append(top_card)
+                    self.deck.shuffle()
+                    card = self.deck.draw()
                 if not card:
-                    # Reshuffle discard pile if deck is empty
-                    if len(self.discard_pile) > 1:  # Keep top card
-                        self.deck.cards = self.discard_pile[:-1]
-                        self.deck.shuffle()
-                        self.discard_pile = [self.discard_pile[-1]]
-                        card = self.deck.draw()
-                    if not card:
-                        raise ValueError("No cards left to draw")
+                    raise ValueError("No cards left to draw")
 
-            player.hand.append(card)
+        player.hand.append(card)
 
-            self.last_action = {
-                'action': 'card_drawn',
-                'player': player.id,
-                'from_discard': from_discard,
-                'card': card.to_dict() if from_discard else None,
-                'game_state': self.state.value
-            }
+        self.last_action = {
+            'action': 'card_drawn',
+            'player': player.id,
+            'from_discard': from_discard,
+            'card': card.to_dict() if from_discard else None,
+            'game_state': self.state.value
+        }
 
-            return self.last_action
-        except Exception as e:
-            raise ValueError(f"Failed to draw card: {str(e)}")
+        return self.last_action
 
     def discard_card(self, player_id: str, card_index: int) -> Dict[str, Any]:
         """Discard a card from hand"""
-        try:
-            if self.state != GameState.PLAYING:
-                raise ValueError("Game is not in playing state")
+        player = self._require_current_player(player_id)
 
-            player = self.players.get(str(player_id))
-            if not player:
-                raise ValueError("Player not found")
+        if card_index < 0 or card_index >= len(player.hand):
+            raise ValueError("Invalid card index")
 
-            if not self.current_player:
-                raise ValueError("No current player set")
+        # Remove card from hand and add to discard pile
+        card = player.hand.pop(card_index)
+        self.discard_pile.append(card)
 
-            if player.id != self.current_player.id:
-                raise ValueError("Not your turn")
+        self.last_action = {
+            'action': 'card_discarded',
+            'player': player.id,
+            'card': card.to_dict(),
+            'game_state': self.state.value
+        }
 
-            if card_index < 0 or card_index >= len(player.hand):
-                raise ValueError("Invalid card index")
-
-            # Remove card from hand and add to discard pile
-            card = player.hand.pop(card_index)
-            self.discard_pile.append(card)
-
-            self.last_action = {
-                'action': 'card_discarded',
-                'player': player.id,
-                'card': card.to_dict(),
-                'game_state': self.state.value
-            }
+        # Move to next player unless it's the final round
+        if not self.final_round:
+            self.next_turn()
+        elif player_id == self.knocked_player_id:
+            # If knocker has discarded, end the round
+            self._end_round()
+        else:
+            self.next_turn()
 
-            # Move to next player unless it's the final round
-            if not self.final_round:
-                self.next_turn()
-            elif player_id == self.knocked_player_id:
-                # If knocker has discarded, end the round
-                self._end_round()
-            else:
-                self.next_turn()
-
-            return self.last_action
-        except Exception as e:
-            raise ValueError(f"Failed to discard card: {str(e)}")
+        return self.last_action
 
     def knock(self, player_id: str) -> Dict[str, Any]:
         """Player knocks to end the round"""
-        try:
-            if self.state != GameState.PLAYING:
-                raise ValueError("Game is not in playing state")
-
-            if self.final_round:
-                raise ValueError("Round is already ending")
-
-            player = self.players.get(str(player_id))
-            if not player:
-                raise ValueError("Player not found")
+        if self.state != GameState.PLAYING:
+            raise ValueError("Game is not in playing state")
 
-            if not self.current_player:
-                raise ValueError("No current player set")
+        if self.final_round:
+            raise ValueError("Round is already ending")
 
-            if player.id != self.current_player.id:
-                raise ValueError("Not your turn")
+        player = self._require_current_player(player_id)
 
-            if len(player.hand) != 3:
-                raise ValueError("Must have exactly 3 cards to knock")
+        if len(player.hand) != 3:
+            raise ValueError("Must have exactly 3 cards to knock")
 
-            self.knocked_player_id = player_id
-            self.final_round = True
+        self.knocked_player_id = player_id
+        self.final_round = True
 
-            self.last_action = {
-                'action': 'player_knocked',
-                'player': player_id,
-                'game_state': self.state.value
-            }
+        self.last_action = {
+            'action': 'player_knocked',
+            'player': player_id,
+            'game_state': self.state.value
+        }
 
-            # Move to next player
-            self.next_turn()
+        # Move to next player
+        self.next_turn()
 
-            return self.last_action
-        except Exception as e:
-            raise ValueError(f"Failed to knock: {str(e)}")
+        return self.last_action
 
     def _end_round(self):
         """End the current round and determine results"""
         try:
-            # Calculate scores
+            # Calculate scores, tracking the lowest score(s) as we go
             scores = {}
+            min_score = None
+            losers = []
             for player_id, player in self.players.items():
-                scores[str(player_id)] = self._calculate_hand_value(player.hand)
-
-            # Find lowest score(s)
-            min_score = min(scores.values())
-            losers = [pid for pid, score in scores.items() if score == min_score]
+                score = scores[player_id] = self._calculate_hand_value(player.hand)
+                if min_score is None or score < min_score:
+                    min_score = score
+                    losers = [player_id]
+                elif score == min_score:
+                    losers.append(player_id)
 
             # Deduct lives from losers
             for loser_id in losers:
                 self.lives[loser_id] = max(0, self.lives[loser_id] - 1)
+            self._lives_snapshot = None
 
-            # Check for eliminated players
-            eliminated = [pid for pid, lives in self.lives.items() if lives <= 0]
+            # Split players into those with lives left and those eliminated
+            alive = []
+            eliminated = []
+            for pid, lives in self.lives.items():
+                (alive if lives > 0 else eliminated).append(pid)
             
-            if len([pid for pid, lives in self.lives.items() if lives > 0]) <= 1:
+            if len(alive) <= 1:
                 # Game over - only one player left with lives
                 self.state = GameState.GAME_END
                 # Find winner
-                winner = next(pid for pid, lives in self.lives.items() if lives > 0)
+                winner = alive[0]
                 self.players[winner].score += 1
             else:
                 # Reset for next round
@@ -212,15 +172,11 @@ class ScatGame(BaseGame):
                 self.final_round = False
                 self.knocked_player_id = None
                 
-                # Collect all cards
+                # Clear hands and discard pile; start_game deals from a fresh deck
                 for player in self.players.values():
-                    self.deck.cards.extend(player.hand)
                     player.hand.clear()
-                self.deck.cards.extend(self.discard_pile)
                 self.discard_pile.clear()
-                
-                # Shuffle and deal new hands
-                self.deck.shuffle()
+
                 super().start_game()
                 
                 # Move to next round
@@ -230,7 +186,7 @@ class ScatGame(BaseGame):
                 'action': 'round_end',
                 'scores': scores,
                 'losers': losers,
-                'lives': self.lives.copy(),
+                'lives': self._get_lives_snapshot(),
                 'eliminated': eliminated,
                 'game_state': self.state.value,
                 'game_over': self.state == GameState.GAME_END
@@ -238,40 +194,39 @@ class ScatGame(BaseGame):
 
             if self.state == GameState.GAME_END:
                 # Add winner to last action
-                winner = next(pid for pid, lives in self.lives.items() if lives > 0)
                 self.last_action['winner'] = winner
 
             return self.last_action
         except Exception as e:
             raise ValueError(f"Failed to end round: {str(e)}")
 
+    def _get_lives_snapshot(self) -> Dict[str, int]:
+        """Get a copy of lives, made once per change and shared between calls - copy it before modifying"""
+        if self._lives_snapshot is None:
+            self._lives_snapshot = self.lives.copy()
+        return self._lives_snapshot
+
     def get_game_state(self, for_player_id: Optional[str] = None) -> Dict[str, Any]:
         """Get the current game state"""
         try:
             # Get base game state
             base_state = super().get_game_state(for_player_id)
             
-            # Get discard pile top safely
-            discard_top = None
-            try:
-                if self.discard_pile:
-                    discard_top = self.discard_pile[-1].to_dict()
-            except Exception:
-                # If there's any error getting discard top, leave it as None
-                pass
+            discard_top = self.discard_pile[-1].to_dict() if self.discard_pile else None
             
             # Create scat specific state
             scat_state = {
                 'discard_pile_top': discard_top,
-                'cards_in_deck': len(self.deck.cards),
+                'cards_in_deck': self._cards_in_deck(),
                 'final_round': self.final_round,
                 'knocked_player': self.knocked_player_id,
-                'lives': self.lives.copy(),
+                'lives': self._get_lives_snapshot(),
                 'last_action': self.last_action
             }
             
             # Merge states
-            return {**base_state, **scat_state}
+            base_state.update(scat_state)
+            return base_state
             
         except Exception as e:
             # Return minimal valid state on error
@@ -1,4 +1,4 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from .models import BaseGame, Card, GameState
 import time
 
@@ -6,8 +6,10 @@ class SnapGame(BaseGame):
     def __init__(self, room_code: str):
         super().__init__(room_code)
         self.center_pile: List[Card] = []
-        self.last_snap_time: Dict[str, float] = {}  # player_id -> last snap time
-        self.snap_window = 0.1  # 100ms window for simultaneous snaps
+        self._center_pile_dicts: List[Dict[str, str]] = []  # Serialized center_pile, rebuilt as cards are played
+        self._center_pile_source: Optional[List[Card]] = None  # The center_pile list _center_pile_dicts was built from
+        self._earliest_snap: Optional[Tuple[int, str]] = None  # (monotonic ns, player_id) of the first snap in the current window
+        self.snap_window = 100_000_000  # 100ms window for simultaneous snaps, in nanoseconds
         self.last_card_time: Optional[float] = None
         self.card_play_timeout = 5.0  # 5 seconds to play a card
 
@@ -40,141 +42,138 @@ class SnapGame(BaseGame):
                     
         # Initialize game-specific state
         self.center_pile = []
-        self.last_snap_time = {}
+        self._earliest_snap = None
         self.last_card_time = None
 
     def play_card(self, player_id: str) -> Dict[str, Any]:
         """Play a card from the player's hand to the center"""
-        try:
-            if self.state != GameState.PLAYING:
-                raise ValueError("Game is not in playing state")
+        player = self._require_current_player(player_id)
 
-            player = self.players.get(str(player_id))
-            if not player:
-                raise ValueError("Player not found")
+        if not player.hand:
+            raise ValueError("No cards in hand")
 
-            if not self.current_player:
-                raise ValueError("No current player set")
+        # Play the top card
+        card = player.hand.pop()
+        self.center_pile.append(card)
+        self.last_card_time = time.time()
 
-            if player.id != self.current_player.id:
-                raise ValueError("Not your turn")
+        # Move to next player
+        self.next_turn()
 
-            if not player.hand:
-                raise ValueError("No cards in hand")
-
-            # Play the top card
-            card = player.hand.pop()
-            self.center_pile.append(card)
-            self.last_card_time = time.time()
-
-            # Move to next player
-            self.next_turn()
-
-            # Update game state
-            self.last_action = {
-                'action': 'card_played',
-                'player': player_id,
-                'card': card.to_dict(),
-                'game_state': self.state
-            }
+        # Update game state
+        self.last_action = {
+            'action': 'card_played',
+            'player': player_id,
+            'card': card.to_dict(),
+            'game_state': self.state
+        }
 
-            # Save game state
-            self._save_game_state()
+        # Save game state
+        self._save_game_state()
 
-            return self.get_game_state()
-        except Exception as e:
-            raise ValueError(f"Failed to play card: {str(e)}")
+        return self.get_game_state()
 
     def snap(self, player_id: str) -> Dict[str, Any]:
         """Player calls snap on matching cards"""
-        try:
-            if self.state != GameState.PLAYING:
-                raise ValueError("Game is not in playing state")
-
-            if len(self.center_pile) < 2:
-                raise ValueError("Not enough cards to snap")
-
-            player = self.players.get(str(player_id))
-            if not player:
-                raise ValueError("Player not found")
-
-            current_time = time.time()
-            self.last_snap_time[str(player_id)] = current_time
-
-            # Check if cards match
-            top_card = self.center_pile[-1]
-            second_card = self.center_pile[-2]
-            cards_match = top_card.rank == second_card.rank
-
-            if not cards_match:
-                # Penalty: Player must give one card to each other player
-                penalty_cards = []
-                if player.hand:
-                    for _ in range(min(len(self.players) - 1, len(player.hand))):
-                        penalty_cards.append(player.hand.pop())
-
-                if penalty_cards:
-                    other_players = [p for p in self.players.values() if p.id != str(player_id)]
-                    for i, card in enumerate(penalty_cards):
-                        other_players[i % len(other_players)].hand.append(card)
-
-                # Update game state if player is out of cards
-                if not player.hand:
-                    players_with_cards = [p for p in self.players.values() if p.hand]
-                    if len(players_with_cards) <= 1:
-                        self.state = GameState.GAME_END
-                        if players_with_cards:
-                            players_with_cards[0].score += 1
-
-                return {
-                    'action': 'snap_failed',
-                    'player': player.id,
-                    'penalty_cards': len(penalty_cards),
-                    'game_state': self.state.value
-                }
-
-            # Find all players who snapped within the time window
-            valid_snaps = {
-                pid: t for pid, t in self.last_snap_time.items()
-                if current_time - t <= self.snap_window
-            }
-
-            if not valid_snaps:
-                return {'action': 'no_valid_snaps'}
-
-            # Find the fastest player
-            winner_id = min(valid_snaps.items(), key=lambda x: x[1])[0]
-            winner = self.players.get(str(winner_id))
-            if not winner:
-                return {'action': 'no_valid_snaps'}
-
-            # Calculate points based on center pile size
-            points = len(self.center_pile) // 2  # 1 point per pair
-            winner.score += points
-
-            # Winner gets all cards from the center pile
-            center_pile_size = len(self.center_pile)
-            winner.hand.extend(self.center_pile)
-            self.center_pile.clear()
-            self.last_snap_time.clear()
-            self.last_card_time = None
-
-            # Check if game is over
-            players_with_cards = [p for p in self.players.values() if p.hand]
-            if len(players_with_cards) <= 1:
-                self.state = GameState.GAME_END
-                if players_with_cards:
-                    players_with_cards[0].score += 1
+        if self.state != GameState.PLAYING:
+            raise ValueError("Game is not in playing state")
+
+        if len(self.center_pile) < 2:
+            raise ValueError("Not enough cards to snap")
+
+        player = self._require_player(player_id)
+
+        # Start a new window unless an earlier snap is still within it
+        current_time = time.monotonic_ns()
+        earliest_snap = self._earliest_snap
+        if earliest_snap is None or current_time - earliest_snap[0] > self.snap_window:
+            earliest_snap = self._earliest_snap = (current_time, player.id)
+
+        # Check if cards match
+        top_card = self.center_pile[-1]
+        second_card = self.center_pile[-2]
+        cards_match = top_card.rank == second_card.rank
+
+        if not cards_match:
+            # Penalty: Player must give one card to each other player, taken from the top of their hand
+            penalty_cards = []
+            penalty_count = min(len(self.players) - 1, len(player.hand))
+            if penalty_count:
+                penalty_cards = player.hand[-penalty_count:]
+                del player.hand[-penalty_count:]
+                penalty_cards.reverse()
+
+                other_players = [p for p in self.players.values() if p.id != player.id]
+                num_others = len(other_players)
+                for i, other_player in enumerate(other_players):
+                    other_player.hand.extend(penalty_cards[i::num_others])
+
+            # Update game state if player is out of cards
+            if not player.hand:
+                self._check_game_over()
 
             return {
-                'action': 'snap_success',
-                'player': winner.id,
-                'cards_won': center_pile_size,
-                'points_earned': points,
+                'action': 'snap_failed',
+                'player': player.id,
+                'penalty_cards': len(penalty_cards),
                 'game_state': self.state.value
             }
-        except Exception as e:
-            raise ValueError(f"Failed to process snap: {str(e)}")
+
+        # The fastest player is whoever opened the current snap window
+        winner = self.players.get(earliest_snap[1])
+        if not winner:
+            return {'action': 'no_valid_snaps'}
+
+        # Calculate points based on center pile size
+        points = len(self.center_pile) // 2  # 1 point per pair
+        winner.score += points
+
+        # Winner gets all cards from the center pile
+        center_pile_size = len(self.center_pile)
+        winner.hand.extend(self.center_pile)
+        self.center_pile.clear()
+        self._center_pile_dicts = []
+        self._earliest_snap = None
+        self.last_card_time = None
+
+        # Check if game is over
+        self._check_game_over()
+
+        return {
+            'action': 'snap_success',
+            'player': winner.id,
+            'cards_won': center_pile_size,
+            'points_earned': points,
+            'game_state': self.state.value
+        }
+
+    def _check_game_over(self):
+        """End the game once at most one player has cards left, giving that player a point"""
+        players_with_cards = []
+        for p in self.players.values():
+            if p.hand:
+                players_with_cards.append(p)
+                if len(players_with_cards) > 1:
+                    return  # Two players still have cards, no need to look further
+
+        self.state = GameState.GAME_END
+        if players_with_cards:
+            players_with_cards[0].score += 1
+
+    def _serialize_center_pile(self) -> List[Dict[str, str]]:
+        """Serialize the center pile, only converting cards played since the last call.
+
+        A new list is built whenever the pile grows, so states already returned are never changed.
+        """
+        pile = self.center_pile
+        serialized = self._center_pile_dicts
+        # Start over if the pile was replaced (e.g. restored from saved state) or has shrunk
+        if self._center_pile_source is not pile or len(serialized) > len(pile):
+            serialized = self._center_pile_dicts = []
+            self._center_pile_source = pile
+        if len(serialized) < len(pile):
+            serialized = self._center_pile_dicts = serialized + [card.to_dict() for card in pile[len(serialized):]]
+        return serialized
 
     def get_game_state(self, for_player_id: Optional[str] = None) -> Dict[str, Any]:
         """Get the current game state"""
@@ -184,13 +183,13 @@ class SnapGame(BaseGame):
 
             # Create snap-specific state
             snap_state = {
-                'center_pile': [card.to_dict() for card in self.center_pile],
+                'center_pile': self._serialize_center_pile(),
                 'center_pile_count': len(self.center_pile),
                 'can_snap': len(self.center_pile) >= 2,
                 'last_card_time': self.last_card_time,
                 'last_action': {
                     'action': 'card_played',
-                    'player': self.current_player.id if self.current_player else None,
+                    'player': self._current_player_id,
                     'timestamp': self.last_card_time
                 } if self.last_card_time else None
             }
@@ -50,20 +50,19 @@ class SpadesGame(BaseGame):
             if self.state != GameState.STARTING:
                 raise ValueError("Not in bidding phase")
 
-            player = self.players.get(str(player_id))
-            if not player:
-                raise ValueError("Player not found")
+            player = self._require_player(player_id)
 
-            if not self.current_player:
+            current_player_id = self._current_player_id
+            if current_player_id is None:
                 raise ValueError("No current player set")
 
-            if player.id != self.current_player.id:
+            if player.id != current_player_id:
                 raise ValueError("Not your turn to bid")
 
             if bid < 0 or bid > 13:
                 raise ValueError("Bid must be between 0 and 13")
 
-            self.bids[str(player_id)] = bid
+            self.bids[player.id] = bid
             self.last_action = {
                 'action': 'bid_made',
                 'player': player_id,
@@ -121,18 +120,7 @@ class SpadesGame(BaseGame):
     def play_card(self, player_id: str, card_index: int) -> Dict[str, Any]:
         """Play a card to the current trick"""
         try:
-            if self.state != GameState.PLAYING:
-                raise ValueError("Game is not in playing state")
-
-            player = self.players.get(str(player_id))
-            if not player:
-                raise ValueError("Player not found")
-
-            if not self.current_player:
-                raise ValueError("No current player set")
-
-            if player.id != self.current_player.id:
-                raise ValueError("Not your turn")
+            player = self._require_current_player(player_id)
 
             if card_index < 0 or card_index >= len(player.hand):
                 raise ValueError("Invalid card index")
@@ -37,7 +37,7 @@ class SpoonsGame(BaseGame):
         if not player:
             raise ValueError("Player not found")
 
-        if player.id != self.current_player.id:
+        if player.id != self._current_player_id:
             raise ValueError("Not your turn")
 
         if card_index < 0 or card_index >= len(player.hand):
@@ -24,7 +24,7 @@ from slowapi.errors import RateLimitExceeded
 from config import get_settings
 from contextlib import contextmanager
 from starlette.websockets import WebSocketState
-from games.cards import snap, go_fish, bluff, scat, rummy, kings_corner, spades, spoons
+from games import get_game_class
 from games.cards.models import GameState, Card, Rank, Suit
 
 # Enable uvloop for better async performance
@@ -939,20 +939,8 @@ async def start_game(request: Request, game: GameStart):
             )
             players = [dict(row) for row in cursor.fetchall()]
             
-            # Initialize game instance
-            game_classes = {
-                "snap": snap.SnapGame,
-                "go_fish": go_fish.GoFishGame,
-                "bluff": bluff.BluffGame,
-                "scat": scat.ScatGame,
-                "rummy": rummy.RummyGame,
-                "kings_corner": kings_corner.KingsCornerGame,
-                "spades": spades.SpadesGame,
-                "spoons": spoons.SpoonsGame
-            }
-            
             # Create and initialize game instance
-            game_instance = game_classes[game.game_type](game.room_code)
+            game_instance = get_game_class(game.game_type)(game.room_code)
             
             # Add all players and get host ID
             cursor = conn.execute("SELECT host_id FROM rooms WHERE code = ?", (game.room_code,))
@@ -1333,17 +1321,6 @@ async def process_websocket_message(websocket: WebSocket, data: dict, room_code:
                     try:
                         # Handle card game actions
                         logger.info(f"Game type: {result['game_type']}")
-                        game_classes = {
-                            "snap": snap.SnapGame,
-                            "go_fish": go_fish.GoFishGame,
-                            "bluff": bluff.BluffGame,
-                            "scat": scat.ScatGame,
-                            "rummy": rummy.RummyGame,
-                            "kings_corner": kings_corner.KingsCornerGame,
-                            "spades": spades.SpadesGame,
-                            "spoons": spoons.SpoonsGame
-                        }
-                        
                         # Create game instance and restore state
                         logger.info("Creating game instance and restoring state...")
                         
@@ -1353,7 +1330,7 @@ async def process_websocket_message(websocket: WebSocket, data: dict, room_code:
                         
                         try:
                             # Create game instance
-                            game_instance = game_classes[result['game_type']](room_code)
+                            game_instance = get_game_class(result['game_type'])(room_code)
                         except Exception as e:
                             logger.error(f"Error creating game instance: {e}")
                             await websocket.send_json({
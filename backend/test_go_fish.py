@@ -0,0 +1,27 @@
+from games.cards.go_fish import GoFishGame
+from games.cards.models import Deck, Rank
+
+def stack_aces_for_first_player(deck):
+    """Order the deck so the first player is dealt all four aces"""
+    aces = [card for card in deck.cards if card.rank == Rank.ACE]
+    rest = [card for card in deck.cards if card.rank != Rank.ACE]
+    # Cards are dealt from the end of the list, alternating between two players
+    dealt_order = []
+    for ace in aces:
+        dealt_order += [ace, rest.pop()]
+    deck.cards = rest + dealt_order[::-1]
+
+def test_dealt_set_is_booked(monkeypatch):
+    """A four-of-a-kind in the opening hand is booked when the game starts"""
+    monkeypatch.setattr(Deck, 'shuffle', stack_aces_for_first_player)
+
+    game = GoFishGame('TEST')
+    game.add_player('1', 'alice', is_host=True)
+    game.add_player('2', 'bob')
+    game.start_game()
+
+    first = game.players['1']
+    assert [set_cards[0].rank for set_cards in game.sets['1']] == [Rank.ACE]
+    assert first.score == 1
+    assert all(card.rank != Rank.ACE for card in first.hand)
+    assert len(first.hand) == 3